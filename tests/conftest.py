@@ -3,11 +3,28 @@ from zombiotrack.models.building import Building
 from zombiotrack.models.state import ZombieSimulationState
 from zombiotrack.use_cases.zombie_simulation import ZombieEnvironment
 
+TEMPLATE_SHAPES = [(1, 1), (1, 2), (1, 3), (2, 1)]
+
+
+@pytest.fixture(scope="session")
+def building_templates():
+    # Serialized layouts are shared read-only across the whole session;
+    # validating a Building from them is cheaper than rebuilding it.
+    return {
+        (floors, rooms): Building.from_2d_floor_spec(floors, rooms).model_dump()
+        for floors, rooms in TEMPLATE_SHAPES
+    }
+
 
 @pytest.fixture
-def base_building():
+def base_building(building_templates):
     def _create(floors=1, rooms=1):
-        return Building.from_2d_floor_spec(floors_count=floors, rooms_per_floor=rooms)
+        template = building_templates.get((floors, rooms))
+        if template is None:
+            return Building.from_2d_floor_spec(
+                floors_count=floors, rooms_per_floor=rooms
+            )
+        return Building.model_validate(template)
 
     return _create
 
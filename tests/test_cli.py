@@ -0,0 +1,123 @@
+import importlib
+import json
+import re
+import shutil
+import sys
+
+import pytest
+from typer.testing import CliRunner
+
+from zombiotrack.interfaces.cli._cli import app
+from zombiotrack.interfaces.cli.utils import data_management
+from zombiotrack.models.building import Building
+from zombiotrack.models.state import ZombieSimulationState
+from zombiotrack.use_cases.constants import ZOMBIE_COUNT
+
+
+@pytest.fixture
+def sessions_dir(tmp_path, monkeypatch):
+    # Created at import like config.SESSIONS_DIR; only session folders are made lazily.
+    sessions = tmp_path / "sessions"
+    sessions.mkdir()
+    monkeypatch.setattr(data_management, "SESSIONS_DIR", sessions)
+    return sessions
+
+
+def test_save_state_recreates_removed_session_folder(sessions_dir):
+    state = ZombieSimulationState(building=Building.from_2d_floor_spec(1, 1))
+    data_management.save_state("session", None, state)
+    shutil.rmtree(sessions_dir / "session")
+
+    data_management.save_state("session", None, state)
+    assert data_management.load_state("session", None) == state
+
+
+def test_load_state_falls_back_to_json_without_orjson(tmp_path, monkeypatch):
+    path = str(tmp_path / "state.json")
+    state = ZombieSimulationState(building=Building.from_2d_floor_spec(1, 1))
+    data_management.save_state(None, path, state)
+    try:
+        with monkeypatch.context() as patch:
+            patch.setitem(sys.modules, "orjson", None)
+            fallback = importlib.reload(data_management)
+
+            assert fallback.json_loads is json.loads
+            assert fallback.load_state(None, path) == state
+    finally:
+        importlib.reload(data_management)
+
+
+@pytest.fixture
+def state_file(tmp_path):
+    path = str(tmp_path / "state.json")
+    result = CliRunner().invoke(
+        app,
+        ["simulate", "configure", "-fc", "1", "-rpf", "2", "-i", "0,0:2"]
+        + ["--state-file", path],
+    )
+    assert result.exit_code == 0, result.output
+    return path
+
+
+def _daemon(state_file, commands):
+    result = CliRunner().invoke(
+        app, ["simulate", "daemon", "--state-file", state_file], input=commands
+    )
+    assert result.exit_code == 0, result.output
+    return result.output.splitlines()
+
+
+def test_daemon_replies_to_every_command(state_file):
+    replies = _daemon(state_file, "step\nblock 0 1\nbogus\nblock 0\nclean 0 5\n")
+
+    assert replies[0] == "turn 1"
+    assert replies[1] == "block_room 0,1"
+    assert replies[2] == "error: unknown command 'bogus'"
+    assert replies[3].startswith("error: not enough values to unpack")
+    assert replies[4] == "error: Invalid starting room number."
+
+
+def test_daemon_saves_state_at_end_of_input(state_file):
+    _daemon(state_file, "step\nblock 0 1\n")
+
+    state = data_management.load_state(None, state_file)
+    assert state.turn == 1
+    assert state.building.floors[0].rooms[1].blocked
+
+
+def test_daemon_stops_at_quit(state_file):
+    assert _daemon(state_file, "step\nquit\nstep\n") == ["turn 1"]
+    assert data_management.load_state(None, state_file).turn == 1
+
+
+def _generated_session_id(output):
+    found = re.search(r"Generated new session id: (\S+)", output)
+    assert found, output
+    return found.group(1)
+
+
+def test_run_without_session_id_persists_the_generated_session(sessions_dir):
+    result = CliRunner().invoke(
+        app, ["simulate", "run", "3", "-fc", "1", "-rpf", "2", "-i", "0,0:2"]
+    )
+    assert result.exit_code == 0, result.output
+    session_id = _generated_session_id(result.output)
+
+    assert [path.name for path in sessions_dir.iterdir()] == [session_id]
+    assert data_management.load_state(session_id, None).turn == 3
+
+
+def test_interactive_without_session_id_persists_the_generated_session(
+    sessions_dir,
+):
+    result = CliRunner().invoke(
+        app,
+        ["interactive", "run", "-fc", "1", "-rpf", "2", "-i", "0,0:2"],
+        input="7\n",
+    )
+    assert result.exit_code == 0, result.output
+    session_id = _generated_session_id(result.output)
+
+    assert [path.name for path in sessions_dir.iterdir()] == [session_id]
+    state = data_management.load_state(session_id, None)
+    assert state.infected_coords == {(0, 0): {ZOMBIE_COUNT: 2}}
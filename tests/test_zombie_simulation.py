@@ -1,3 +1,5 @@
+import pytest
+
 from zombiotrack.models.building import Building
 from zombiotrack.models.state import ZombieSimulationState
 from zombiotrack.use_cases.constants import ZOMBIE_COUNT
@@ -25,6 +27,72 @@ def test_step_advances_turn():
     assert env.state.turn == old_turn + 1
 
 
+def test_step_dispatches_registered_actions(zombie_env):
+    env = zombie_env(1, 1)
+    calls = []
+
+    def mark_turn(state):
+        calls.append(state.turn)
+        return state
+
+    env.step_action_lookup[1] = mark_turn
+    env.step(1)
+    env.step(99)  # unknown actions fall back to do_nothing
+    assert calls == [1]
+    assert env.state.turn == 2
+
+
+def test_multi_step_matches_repeated_steps(zombie_env):
+    stepped = zombie_env(2, 3, {(0, 1): {ZOMBIE_COUNT: 4}})
+    for _ in range(3):
+        stepped.state = stepped.step()
+
+    batched = zombie_env(2, 3, {(0, 1): {ZOMBIE_COUNT: 4}})
+    final_state = batched.multi_step(3)
+
+    assert final_state is batched.state
+    assert final_state.turn == 3
+    assert final_state.infected_coords == stepped.state.infected_coords
+
+
+def test_step_leaves_previous_state_untouched(zombie_env):
+    env = zombie_env(1, 2, {(0, 0): {ZOMBIE_COUNT: 2}})
+    previous = env.state
+    next_state = env.step()
+
+    assert next_state is env.state
+    assert next_state is not previous
+    assert previous.turn == 0
+    assert previous.infected_coords == {(0, 0): {ZOMBIE_COUNT: 2}}
+    assert previous.building.floors[0].rooms[1].sensor.status == "normal"
+
+
+def test_advance_reports_changes_and_updates_in_place(zombie_env):
+    env = zombie_env(1, 2, {(0, 0): {ZOMBIE_COUNT: 2}})
+    current = env.state
+    snapshot = env.snapshot()
+    result = env.advance()
+
+    assert env.state is current
+    assert result.turn == env.state.turn == 1
+    assert result.deltas == {(0, 1): 2, (0, 0): 0}
+    assert result.triggered == {(0, 1)}
+    assert snapshot.turn == 0
+    assert snapshot.infected_coords == {(0, 0): {ZOMBIE_COUNT: 2}}
+    assert snapshot.building.floors[0].rooms[1].sensor.status == "normal"
+
+
+def test_advance_reports_clamped_net_change(zombie_env):
+    # The centre room sends one zombie to each of its four neighbours, more
+    # than it holds, so its count is clamped at zero.
+    env = zombie_env(3, 3, {(1, 1): {ZOMBIE_COUNT: 1}})
+    result = env.advance()
+
+    assert env.state.infected_coords[(1, 1)][ZOMBIE_COUNT] == 0
+    assert result.deltas[(1, 1)] == -1
+    assert result.deltas[(0, 1)] == 1
+
+
 def test_clean_room_removes_infection():
     building = Building.from_2d_floor_spec(1, 1)
     infected = {(0, 0): {ZOMBIE_COUNT: 2}}
@@ -35,11 +103,43 @@ def test_clean_room_removes_infection():
     assert (0, 0) not in env.state.infected_coords
 
 
-def test_sensor_alert_on_startup(zombie_env):
-    env = zombie_env(1, 1, {(0, 0): {ZOMBIE_COUNT: 1}})
+def _assert_sensor_alert(env):
     assert env.state.building.floors[0].rooms[0].sensor.status == "alert"
 
 
+def _assert_no_zombies(env):
+    assert (0, 0) not in env.state.infected_coords
+
+
+def _assert_sensor_normal(env):
+    assert env.state.building.floors[0].rooms[0].sensor.status == "normal"
+
+
+@pytest.mark.parametrize(
+    ("action", "check"),
+    [
+        pytest.param(None, _assert_sensor_alert, id="sensor_alert_on_startup"),
+        pytest.param(
+            lambda env: env.clean_room(0, 0),
+            _assert_no_zombies,
+            id="clean_room_removes_zombies",
+        ),
+        pytest.param(
+            lambda env: env.reset_sensor(0, 0),
+            _assert_sensor_normal,
+            id="sensor_reset_sets_status_to_normal",
+        ),
+    ],
+)
+def test_single_infected_room(zombie_env, action, check):
+    # A 1x1 environment validates from a cached template, which is cheaper
+    # than deep-copying a shared one.
+    env = zombie_env(1, 1, {(0, 0): {ZOMBIE_COUNT: 1}})
+    if action is not None:
+        action(env)
+    check(env)
+
+
 def test_zombie_spread_adjacent_rooms(zombie_env):
     env = zombie_env(1, 3, {(0, 1): {ZOMBIE_COUNT: 3}})
     next_state = env.step()
@@ -53,23 +153,54 @@ def test_zombie_cross_floor_infection(zombie_env):
     assert (1, 0) in next_state.infected_coords
 
 
+def test_spread_does_not_depend_on_infection_order(zombie_env):
+    first = zombie_env(3, 3, {(1, 1): {ZOMBIE_COUNT: 1}, (0, 1): {ZOMBIE_COUNT: 1}})
+    second = zombie_env(3, 3, {(0, 1): {ZOMBIE_COUNT: 1}, (1, 1): {ZOMBIE_COUNT: 1}})
+    first.step()
+    second.step()
+    assert first.state.infected_coords == second.state.infected_coords
+
+
+def test_stochastic_spread_is_reproducible_with_seed(base_state):
+    def run(seed):
+        state = base_state(3, 3, {(1, 1): {ZOMBIE_COUNT: 20}})
+        env = ZombieEnvironment(state, stochastic=True, seed=seed)
+        return env.multi_step(5).infected_coords
+
+    assert run(7) == run(7)
+
+
+def test_events_log_keeps_most_recent_entries(base_state):
+    state = base_state(1, 3, {(0, 1): {ZOMBIE_COUNT: 3}})
+    bounded = ZombieEnvironment(state, events_log_capacity=4)
+    unbounded = ZombieEnvironment(state, events_log_capacity=None)
+    bounded.multi_step(3)
+    unbounded.multi_step(3)
+
+    assert len(unbounded.state.infection_events_log) > 4
+    assert (
+        bounded.state.infection_events_log
+        == (unbounded.state.infection_events_log[-4:])
+    )
+
+
 def test_blocked_room_prevents_infection(zombie_env):
     env = zombie_env(1, 2, {(0, 0): {ZOMBIE_COUNT: 2}})
-    env.state.building.floors[0].rooms[1].blocked = True
+    env.block_room(0, 1)
     next_state = env.step()
     assert (0, 1) not in next_state.infected_coords
 
 
-def test_clean_room_removes_zombies(zombie_env):
-    env = zombie_env(1, 1, {(0, 0): {ZOMBIE_COUNT: 2}})
-    env.clean_room(0, 0)
-    assert (0, 0) not in env.state.infected_coords
-
-
-def test_sensor_reset_sets_status_to_normal(zombie_env):
-    env = zombie_env(1, 1, {(0, 0): {ZOMBIE_COUNT: 1}})
-    env.reset_sensor(0, 0)
-    assert env.state.building.floors[0].rooms[0].sensor.status == "normal"
+def test_neighbor_table_follows_blocked_rooms(zombie_env):
+    env = zombie_env(1, 3, {(0, 0): {ZOMBIE_COUNT: 4}})
+    env.step()
+    env.clean_room(0, 1)
+    env.block_room(0, 1)
+    env.step()
+    assert (0, 1) not in env.state.infected_coords
+    env.unblock_room(0, 1)
+    env.step()
+    assert (0, 1) in env.state.infected_coords
 
 
 def test_block_unblock_room(zombie_env):
@@ -80,9 +211,162 @@ def test_block_unblock_room(zombie_env):
     assert not env.state.building.floors[0].rooms[0].blocked
 
 
+def test_room_mutators_copy_only_the_changed_room(zombie_env):
+    env = zombie_env(2, 2, {(0, 0): {ZOMBIE_COUNT: 1}})
+    previous = env.state
+    env.block_room(1, 1)
+    env.reset_sensor(0, 0)
+
+    assert not previous.building.floors[1].rooms[1].blocked
+    assert previous.building.floors[0].rooms[0].sensor.status == "alert"
+    assert env.state.building.floors[1].rooms[1].blocked
+    assert env.state.building.floors[0].rooms[0].sensor.status == "normal"
+    # Rooms that did not change are shared rather than copied.
+    assert env.state.building.floors[0].rooms[1] is previous.building.floors[0].rooms[1]
+
+
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        pytest.param(lambda env: env.block_room(0, 1), id="block"),
+        pytest.param(lambda env: env.unblock_room(1, 1), id="unblock"),
+        pytest.param(lambda env: env.clean_room(0, 0), id="clean"),
+        pytest.param(lambda env: env.reset_sensor(0, 0), id="reset_sensor"),
+        pytest.param(lambda env: env.reset_simulation({}), id="reset_simulation"),
+        pytest.param(lambda env: env.step(), id="step"),
+        pytest.param(lambda env: env.multi_step(2), id="multi_step"),
+        pytest.param(lambda env: env.advance(), id="advance"),
+    ],
+)
+def test_mutators_leave_captured_states_unchanged(zombie_env, mutate):
+    env = zombie_env(2, 2, {(0, 0): {ZOMBIE_COUNT: 2}})
+    env.block_room(1, 1)
+    previous = env.state
+    snapshot = env.snapshot()
+    expected = previous.model_dump()
+    mutate(env)
+
+    assert snapshot.model_dump() == expected
+    # `advance` updates the current state in place by design.
+    if env.state is not previous:
+        assert previous.model_dump() == expected
+
+
 def test_reset_simulation_keeps_structure(zombie_env):
     env = zombie_env(1, 1, {(0, 0): {ZOMBIE_COUNT: 1}})
     env.reset_simulation(infected_coords=None)
     assert env.state.turn == 0
     assert env.state.infected_coords == {}
     assert len(env.state.building.floors) == 1
+
+
+def test_environment_uses_slots(zombie_env):
+    env = zombie_env(1, 1)
+    assert "state" in ZombieEnvironment.__slots__
+    assert not hasattr(env, "__dict__")
+
+
+def test_building_accepts_legacy_floor_and_room_mappings():
+    legacy = {
+        "floors_count": 2,
+        "rooms_per_floor": 1,
+        "floors": {
+            "1": {"floor_number": 1, "rooms": {"0": {"room_number": 0, "sensor": {}}}},
+            "0": {"floor_number": 0, "rooms": {"0": {"room_number": 0, "sensor": {}}}},
+        },
+    }
+    building = Building.model_validate(legacy)
+    assert [floor.floor_number for floor in building.floors] == [0, 1]
+    assert building.floors[1].rooms[0].room_number == 0
+
+
+def test_update_building_size_keeps_rooms_contiguous():
+    building = Building.from_2d_floor_spec(1, 2)
+    building.update_building_size(new_floors_count=2, new_rooms_per_floor=3)
+    for floor in building.floors:
+        assert [room.room_number for room in floor.rooms] == [0, 1, 2]
+    building.update_building_size(new_floors_count=1, new_rooms_per_floor=1)
+    assert len(building.floors) == 1
+    assert len(building.floors[0].rooms) == 1
+
+
+def test_update_building_size_does_not_touch_shared_floors(zombie_env):
+    env = zombie_env(2, 3)
+    previous = env.state
+    env.step()
+    # A shallow copy still shares its floor and room lists with `previous`.
+    resized = env.state.building.model_copy()
+    resized.update_building_size(new_floors_count=1, new_rooms_per_floor=2)
+
+    assert len(previous.building.floors) == 2
+    assert all(len(floor.rooms) == 3 for floor in previous.building.floors)
+    assert [len(floor.rooms) for floor in resized.floors] == [2]
+
+
+def test_zombie_count_grid_tracks_infection(zombie_env):
+    env = zombie_env(1, 2, {(0, 0): {ZOMBIE_COUNT: 2}})
+    assert env.state.zombie_count_grid() == [[2, 0]]
+    env.state = env.step()
+    assert (
+        env.state.zombie_count_at(0, 1)
+        == env.state.infected_coords[(0, 1)][ZOMBIE_COUNT]
+    )
+    env.clean_room(0, 1)
+    assert env.state.zombie_count_at(0, 1) == 0
+
+
+def test_zombie_count_grid_follows_direct_edits(zombie_env):
+    env = zombie_env(1, 2)
+    env.state.infected_coords[(0, 0)] = {ZOMBIE_COUNT: 2}
+    assert env.state.zombie_count_at(0, 0) == 2
+    env.step()
+    assert env.state.zombie_count_at(0, 1) == 2
+
+    copy = env.state.model_copy(update={"infected_coords": {}})
+    assert copy.zombie_count_grid() == [[0, 0]]
+    assert copy.zombie_count_at(0, 1) == 0
+
+
+def test_infection_outside_building_is_rejected(base_building):
+    with pytest.raises(ValueError, match="outside the building"):
+        ZombieSimulationState(
+            building=base_building(1, 1), infected_coords={(0, 3): {ZOMBIE_COUNT: 1}}
+        )
+
+
+def test_saved_state_with_infection_outside_building_is_rejected(base_state):
+    # Such files used to load and only failed once the room was spread from.
+    data = base_state(1, 1).model_dump()
+    data["infected_coords"] = {"0,3": {ZOMBIE_COUNT: 1}}
+    with pytest.raises(ValueError, match=r"Infected room \(0, 3\) is outside"):
+        ZombieSimulationState.model_validate(data)
+
+
+def test_sensor_serializes_as_status_mapping(base_building):
+    building = base_building(1, 1)
+    building.floors[0].rooms[0].sensor.trigger()
+    dumped = building.model_dump(mode="json")
+    assert dumped["floors"][0]["rooms"][0]["sensor"] == {"status": "alert"}
+    restored = Building.model_validate(dumped)
+    assert restored.floors[0].rooms[0].sensor.status == "alert"
+    dumped["floors"][0]["rooms"][0]["sensor"]["status"] = "broken"
+    with pytest.raises(ValueError):
+        Building.model_validate(dumped)
+
+
+def test_state_accepts_string_and_tuple_coordinate_keys(base_building):
+    building = base_building(1, 2).model_dump()
+    from_json = ZombieSimulationState.model_validate(
+        {
+            "building": building,
+            "infected_coords": {"0,1": {ZOMBIE_COUNT: 2}},
+            "infection_events_log": [{"0,0": {ZOMBIE_COUNT: 1}}],
+        }
+    )
+    from_python = ZombieSimulationState(
+        building=building,
+        infected_coords={(0, 1): {ZOMBIE_COUNT: 2}},
+        infection_events_log=[{(0, 0): {ZOMBIE_COUNT: 1}}],
+    )
+    assert from_json.infected_coords == from_python.infected_coords
+    assert from_json.infection_events_log == from_python.infection_events_log
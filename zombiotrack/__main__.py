@@ -17,8 +17,7 @@ if __name__ == "__main__":
     env = ZombieEnvironment(initial_state, stochastic=True)
 
     # Run the simulation for 10 turns.
-    for _ in range(10):
-        env.state = env.step()
+    env.multi_step(10)
 
     # Print the final state of the simulation.
     print(env.state)
@@ -3,7 +3,13 @@ from .control import simulation_app
 from .visualization import visualization_app
 from .interactive import menu_app
 
-app = Typer(help="CLI for the Zombie Invasion Simulation")
+# Plain help rendering and no completion install options keep start-up lean
+# for scripted invocations.
+app = Typer(
+    help="CLI for the Zombie Invasion Simulation",
+    rich_markup_mode=None,
+    add_completion=False,
+)
 app.add_typer(simulation_app, name="simulate")
 app.add_typer(visualization_app, name="visualize")
 app.add_typer(menu_app, name="interactive")
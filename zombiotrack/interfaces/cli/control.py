@@ -1,14 +1,57 @@
 import json
+import re
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING
 from uuid import uuid4
 from typer import echo, Option, Exit, Context, Argument, Typer
 from zombiotrack.interfaces.cli.utils.data_management import load_state, save_state
-from zombiotrack.models.state import ZombieSimulationState
-from zombiotrack.models.building import Building
 from zombiotrack.interfaces.constants import DEFAULT_FLOORS, DEFAULT_ROOMS_PER_FLOOR
 from zombiotrack.use_cases.constants import DO_NOTHING, ZOMBIE_COUNT
-from zombiotrack.use_cases.zombie_simulation import ZombieEnvironment
 
-simulation_app = Typer(help="CLI for the Zombie Invasion Simulation")
+if TYPE_CHECKING:
+    from zombiotrack.use_cases.zombie_simulation import ZombieEnvironment
+
+simulation_app = Typer(
+    help="CLI for the Zombie Invasion Simulation",
+    rich_markup_mode=None,
+    add_completion=False,
+)
+
+# Matches a single 'floor,room:count' infection spec, tolerating whitespace.
+_INFECTED_PATTERN = re.compile(r"\s*(\d+)\s*,\s*(\d+)\s*:\s*(\d+)\s*")
+
+
+@lru_cache(maxsize=16)
+def _building_template(floors_count: int, rooms_per_floor: int) -> dict:
+    """
+    Build and cache the serialized layout of a pristine building.
+
+    Validating a new `Building` from this dump with `model_validate` is cheaper
+    than rebuilding it with `Building.from_2d_floor_spec`, which constructs and
+    validates every Floor, Room and Sensor one call at a time. The model
+    validators still run, so the result is checked like any other building.
+    Deep-copying a cached model instance is slower than both, so the cache
+    stores plain data.
+
+    Parameters
+    ----------
+    floors_count : int
+        Total number of floors in the building.
+    rooms_per_floor : int
+        Number of rooms per floor.
+
+    Returns
+    -------
+    dict
+        The `model_dump()` of the building. Treat it as read-only.
+    """
+    from zombiotrack.models.building import Building
+
+    return Building.from_2d_floor_spec(
+        floors_count=floors_count, rooms_per_floor=rooms_per_floor
+    ).model_dump()
 
 
 @simulation_app.command()
@@ -65,12 +108,66 @@ def configure(
     str
         The session ID used to save the simulation state.
     """
+    session_id, _ = _configure(
+        floors_count=floors_count,
+        rooms_per_floor=rooms_per_floor,
+        infected=infected,
+        config_file=config_file,
+        state_file=state_file,
+        session_id=session_id,
+    )
+    return session_id
+
+
+def _configure(
+    floors_count: int,
+    rooms_per_floor: int,
+    infected: list[str],
+    config_file: str | None,
+    state_file: str | None,
+    session_id: str | None,
+    save: bool = True,
+) -> tuple[str | None, "ZombieEnvironment"]:
+    """
+    Build a new simulation environment, optionally saving its initial state.
+
+    Shared implementation of the `configure` command. Composite commands call
+    it with ``save=False`` and persist the environment themselves once they
+    are done with it, avoiding a write that would be overwritten right away.
+
+    Parameters
+    ----------
+    floors_count : int
+        Number of floors to create in the building.
+    rooms_per_floor : int
+        Number of rooms per floor.
+    infected : list of str
+        List of coordinates and zombie counts in the format 'floor,room:count'.
+    config_file : str, optional
+        Path to a configuration file containing floors, rooms, and infection data.
+    state_file : str, optional
+        Path of the state file to use instead of a session folder.
+    session_id : str, optional
+        The session ID to use; if not provided, a new one will be generated.
+    save : bool, optional
+        Whether to write the initial state to disk (default: True).
+
+    Returns
+    -------
+    tuple of (str or None, ZombieEnvironment)
+        The session ID and the configured environment.
+    """
+    # The models pull in pydantic, so they are imported only when a command
+    # needs them and `--help` stays fast.
+    from zombiotrack.models.building import Building
+    from zombiotrack.models.state import ZombieSimulationState
+    from zombiotrack.use_cases.zombie_simulation import ZombieEnvironment
 
     # If a config file is provided, load values from it.
     if config_file:
         try:
-            with open(config_file, "r") as f:
-                data = json.load(f)
+            # json.loads accepts bytes directly, skipping the text-mode decode layer.
+            data = json.loads(Path(config_file).read_bytes())
             floors_count = data.get("floors_count", floors_count)
             rooms_per_floor = data.get("rooms_per_floor", rooms_per_floor)
             infected = data.get("infected", infected)
@@ -83,27 +180,22 @@ def configure(
         session_id = str(uuid4())
         echo(f"Generated new session id: {session_id}")
 
-    building = Building.from_2d_floor_spec(
-        floors_count=floors_count, rooms_per_floor=rooms_per_floor
+    building = Building.model_validate(
+        _building_template(floors_count, rooms_per_floor)
     )
 
     # Parse the infected list if any.
     def parse_infected(infected_list: list[str]) -> dict:
-        infected_coords = {}
-        for item in infected_list:
-            try:
-                echo(f"Item: {item}")
-                coord_part, count_part = item.split(":")
-                floor_str, room_str = coord_part.split(",")
-                floor = int(floor_str.strip())
-                room = int(room_str.strip())
-                count = int(count_part.strip())
-                infected_coords[(floor, room)] = {ZOMBIE_COUNT: count}
-            except Exception as e:
+        matches = [_INFECTED_PATTERN.fullmatch(item) for item in infected_list]
+        for item, found in zip(infected_list, matches):
+            if found is None:
                 raise ValueError(
                     f"Invalid format '{item}'. Expected 'floor,room:count'."
-                ) from e
-        return infected_coords
+                )
+        return {
+            (int(floor), int(room)): {ZOMBIE_COUNT: int(count)}
+            for floor, room, count in (found.groups() for found in matches)
+        }
 
     initial_infected = parse_infected(infected) if infected else {}
     initial_state = ZombieSimulationState(
@@ -113,12 +205,13 @@ def configure(
         last_action_payload={"infected": initial_infected},
     )
     env = ZombieEnvironment(initial_state)
-    # Save the serialized environment (state) to file.
-    save_state(session_id, state_file, env.state)
+    if save:
+        # Save the serialized environment (state) to file.
+        save_state(session_id, state_file, env.state)
     echo(f"Simulation configured with {floors_count} floors, {rooms_per_floor} rooms.")
     echo(f"Initial infected: {initial_infected}")
     echo(f"Session id: {session_id if session_id else state_file}")
-    return session_id
+    return session_id, env
 
 
 @simulation_app.command()
@@ -155,6 +248,7 @@ def step(
     None
         The updated state is saved, and the new turn number is printed.
     """
+    from zombiotrack.use_cases.zombie_simulation import ZombieEnvironment
 
     state = load_state(session_id, state_file)
     env = ZombieEnvironment(state)
@@ -170,11 +264,14 @@ def fallback_config(
     infected: list[str],
     state_file: str | None,
     session_id: str | None,
+    save: bool = False,
 ):
     """
     Fallback logic to reconfigure the simulation if any configuration options are provided.
 
-    If floors, rooms, or infected coordinates are specified, it triggers the `configure` function.
+    If floors, rooms, or infected coordinates are specified, it builds a new
+    environment through `_configure` and stashes it on ``ctx.obj["env"]`` so
+    the caller can use it without reloading the state file.
     Used internally by composite commands like `run`.
 
     Parameters
@@ -191,18 +288,20 @@ def fallback_config(
         Path to a file to save the updated simulation state.
     session_id : str, optional
         Optional session ID to use.
+    save : bool, optional
+        Whether to write the new initial state to disk right away. Callers
+        that save at the end of their own work leave it False (default).
 
     Returns
     -------
     str or None
-        The session ID used after reconfiguration, or None if no reconfiguration was needed.
+        The session ID used after reconfiguration, or the given `session_id` if no
+        reconfiguration was needed.
     """
 
-    session_id = None
     # If any reconfiguration options are provided, call 'configure' and override.
     if floors_count is not None or rooms_per_floor is not None or infected:
-        session_id = ctx.invoke(
-            configure,
+        session_id, env = _configure(
             floors_count=floors_count if floors_count is not None else DEFAULT_FLOORS,
             rooms_per_floor=rooms_per_floor
             if rooms_per_floor is not None
@@ -211,7 +310,9 @@ def fallback_config(
             config_file=None,
             state_file=state_file,
             session_id=session_id,
+            save=save,
         )
+        ctx.obj = {"env": env}
     return session_id
 
 
@@ -263,6 +364,7 @@ def run(
     None
         State is updated and saved after running the simulation.
     """
+    from zombiotrack.use_cases.zombie_simulation import ZombieEnvironment
 
     session_id = fallback_config(
         ctx=ctx,
@@ -273,11 +375,84 @@ def run(
         session_id=session_id,
     )
 
-    state = load_state(session_id, state_file)
-    env = ZombieEnvironment(state)
-    for _ in range(steps):
-        env.state = env.step()
+    # Reuse the environment built by `configure` instead of reloading it from disk.
+    env = (ctx.obj or {}).get("env")
+    if env is None:
+        state = load_state(session_id, state_file)
+        env = ZombieEnvironment(state)
+    env.multi_step(steps)
     save_state(session_id, state_file, env.state)
     echo(
         f"Composite run complete. Turn: {env.state.turn}, Last action: {env.state.last_action}"
     )
+
+
+@simulation_app.command()
+def daemon(
+    session_id: str | None = Option(None, "--session-id", "-s", help="Session ID"),
+    state_file: str | None = Option(None, "--state-file", help="Path to state file"),
+):
+    """
+    Serve simulation commands read line by line from standard input.
+
+    Loads the simulation state once and keeps the environment in memory, so
+    scripted sessions pay the interpreter and CLI start-up cost a single time
+    instead of once per turn. Every command prints exactly one reply line.
+
+    Supported commands:
+
+    - ``step [action]``: advance the simulation by one turn.
+    - ``clean FLOOR ROOM``: remove the infection from a room.
+    - ``reset-sensor FLOOR ROOM``: reset the sensor of a room.
+    - ``block FLOOR ROOM`` / ``unblock FLOOR ROOM``: manage room access.
+    - ``save``: write the current state to disk.
+    - ``quit``: stop reading commands.
+
+    Parameters
+    ----------
+    session_id : str, optional
+        Session ID to load the state from.
+    state_file : str, optional
+        Path to the state file. If provided, it overrides session_id.
+
+    Returns
+    -------
+    None
+        The state is saved when the input ends or ``quit`` is received.
+    """
+    from zombiotrack.use_cases.zombie_simulation import ZombieEnvironment
+
+    state = load_state(session_id, state_file)
+    env = ZombieEnvironment(state)
+    # Commands that act on a single room, mapped to the bound environment methods.
+    room_commands = {
+        "clean": env.clean_room,
+        "reset-sensor": env.reset_sensor,
+        "block": env.block_room,
+        "unblock": env.unblock_room,
+    }
+
+    for line in sys.stdin:
+        command, *args = line.split() or [""]
+        if not command:
+            continue
+        if command == "quit":
+            break
+        try:
+            if command == "save":
+                save_state(session_id, state_file, env.state)
+                echo("saved")
+            elif command == "step":
+                action = int(args[0]) if args else DO_NOTHING
+                # Nothing else holds the previous turn, so advance in place.
+                echo(f"turn {env.advance(action).turn}")
+            elif command in room_commands:
+                floor, room = (int(arg) for arg in args)
+                env.state = room_commands[command](floor, room)
+                echo(f"{env.state.last_action} {floor},{room}")
+            else:
+                echo(f"error: unknown command '{command}'")
+        except ValueError as e:
+            echo(f"error: {e}")
+
+    save_state(session_id, state_file, env.state)
@@ -1,15 +1,31 @@
 # zombiotrack/interfaces/cli/menu.py
+from copy import deepcopy
 from json import dumps
 from typer import Option, Context, Typer, echo, prompt
 from zombiotrack.interfaces.cli.control import fallback_config
 from zombiotrack.interfaces.cli.utils.data_management import load_state
-from zombiotrack.use_cases.zombie_simulation import ZombieEnvironment
-from rich.console import Console
-from zombiotrack.interfaces.cli.visualization import render_grid
-from re import match
+from zombiotrack.interfaces.cli.visualization import get_console, render_grid
+import re
 
 menu_app = Typer()
-console = Console()
+
+# Matches a 'floor,room' coordinate prompt answer; multi-digit values allowed.
+_COORD_PATTERN = re.compile(r"^(\d+),(\d+)$")
+
+# Menu bodies, each printed as a single panel so a menu is one terminal write.
+_INFECTION_MENU = "1. Add initial zombies 🧟\nAny. Done ✅"
+_MAIN_MENU = "\n".join(
+    [
+        "1. Advance turn 🧟",
+        "2. Show building state 🏢",
+        "3. Clean a room 🧼",
+        "4. Manage room access 🚪",
+        "5. Reset a sensor 🔁",
+        "6. Reset simulation 💥",
+        "7. Exit ❌",
+    ]
+)
+_ROOM_ACCESS_MENU = "1. Block room 🚪\n2. Unblock room 🔓"
 
 
 def prompt_int(prompt_msg: str, min_value: int = 0) -> int:
@@ -31,16 +47,21 @@ def prompt_int(prompt_msg: str, min_value: int = 0) -> int:
     int
         A valid integer value provided by the user.
     """
+    console = get_console()
 
     while True:
-        try:
-            value = int(prompt(prompt_msg))
-            if value < min_value:
-                console.print("[red]Value must be non-negative.[/red]")
-                continue
-            return value
-        except ValueError:
+        # isdecimal() accepts exactly the digit strings int() can parse, so bad
+        # input is rejected without raising; a leading minus is still reported
+        # as a negative value.
+        user_input = prompt(prompt_msg).strip()
+        if not user_input.removeprefix("-").isdecimal():
             console.print("[red]Invalid input. Enter a valid number.[/red]")
+            continue
+        value = int(user_input)
+        if value < min_value:
+            console.print("[red]Value must be non-negative.[/red]")
+            continue
+        return value
 
 
 @menu_app.command("run")
@@ -88,6 +109,10 @@ def interactive(
     None
         The loop runs until the user selects "Exit". Simulation state is updated in memory.
     """
+    from rich.panel import Panel
+    from zombiotrack.use_cases.zombie_simulation import ZombieEnvironment
+
+    console = get_console()
 
     if not (rooms_per_floor and floors_count) and (
         session_id is None and state_file is None
@@ -105,27 +130,32 @@ def interactive(
     if not infected and (session_id is None and state_file is None):
         echo("Provide infected population")
         while True:
-            console.print("\n[bold cyan]--- Initial infection ---[/bold cyan]")
-            console.print("1. Add initial zombies 🧟")
-            console.print("Any. Done ✅")
+            console.print(
+                Panel.fit(
+                    _INFECTION_MENU,
+                    title="[bold cyan]Initial infection[/bold cyan]",
+                    border_style="cyan",
+                )
+            )
 
             option = prompt("\nSelect an option")
 
             if option == "1":
-                room, floor = (None, None)
+                floor, room = (None, None)
                 quantity: int | None = None
                 echo("Replace zombies at location.")
                 while room is None or floor is None:
                     user_input: str = prompt(
                         "Select a Floor and Room. (format: 'floor,room')"
                     )
-                    if match(r"^(\d,\d)$", user_input):
-                        room, floor = user_input.split(",")
+                    coords = _COORD_PATTERN.match(user_input)
+                    if coords:
+                        floor, room = coords.groups()
                 while quantity is None:
                     user_input: str = prompt(
                         "How much zombies do you want on that location?"
                     )
-                    if user_input.isdigit() and int(user_input) >= 0:
+                    if user_input.strip().isdecimal():
                         quantity = int(user_input)
                 infected.append(f"{floor},{room}:{quantity}")
                 echo(f"Current zombie configuration: {dumps(infected)}")
@@ -140,31 +170,39 @@ def interactive(
             infected=infected,
             state_file=state_file,
             session_id=session_id,
+            save=True,
         )
 
-    state = load_state(session_id, state_file)
-    env = ZombieEnvironment(state)
+    # Reuse the environment built by `configure` instead of reloading it from disk.
+    env = (ctx.obj or {}).get("env")
+    if env is None:
+        env = ZombieEnvironment(load_state(session_id, state_file))
+    initial_infected = deepcopy(env.state.infected_coords)
 
     while True:
-        console.print("\n[bold cyan]--- ZOMBIE SIMULATION MENU ---[/bold cyan]")
-        console.print("1. Advance turn 🧟")
-        console.print("2. Show building state 🏢")
-        console.print("3. Clean a room 🧼")
-        console.print("4. Manage room access 🚪")
-        console.print("5. Reset a sensor 🔁")
-        console.print("6. Reset simulation 💥")
-        console.print("7. Exit ❌")
+        console.print(
+            Panel.fit(
+                _MAIN_MENU,
+                title="[bold cyan]ZOMBIE SIMULATION MENU[/bold cyan]",
+                border_style="cyan",
+            )
+        )
 
         option = prompt("\nSelect an option").strip()
+        # Only repaint after actions that may have changed the state; option 2
+        # renders on its own and invalid input leaves the grid untouched.
+        needs_render = False
 
         if option == "1":
             env.state = env.step()
             console.print("[green]Turn advanced.[/green]")
+            needs_render = True
 
         elif option == "2":
             render_grid(env.state)
 
         elif option in {"3", "4", "5"}:
+            needs_render = True
             floor = prompt_int("Floor number")
             room = prompt_int("Room number")
 
@@ -173,9 +211,13 @@ def interactive(
                     env.clean_room(floor, room)
                     console.print(f"[green]Room ({floor},{room}) cleaned.[/green]")
                 elif option == "4":
-                    console.print("\n[bold cyan]--- Room Access Menu ---[/bold cyan]")
-                    console.print("1. Block room 🚪")
-                    console.print("2. Unblock room 🔓")
+                    console.print(
+                        Panel.fit(
+                            _ROOM_ACCESS_MENU,
+                            title="[bold cyan]Room Access Menu[/bold cyan]",
+                            border_style="cyan",
+                        )
+                    )
                     sub_option = prompt("Select an option").strip()
 
                     try:
@@ -205,8 +247,9 @@ def interactive(
             console.print(
                 "\n💥 [bold red]NUKING the simulation... Resetting to zero.[/bold red] 💥"
             )
-            env.reset_simulation(infected_coords=state.infected_coords)
+            env.reset_simulation(infected_coords=initial_infected)
             console.print("[green]Simulation has been reset.[/green]")
+            needs_render = True
 
         elif option == "7":
             console.print("[yellow]Exiting interactive mode.[/yellow]")
@@ -215,4 +258,5 @@ def interactive(
         else:
             console.print("[red]Invalid option. Try again.[/red]")
 
-        render_grid(env.state)
+        if needs_render:
+            render_grid(env.state)
@@ -1,10 +1,18 @@
-import json
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from typer import Exit, echo
 
 from zombiotrack.interfaces.cli.config import SESSIONS_DIR
-from zombiotrack.models.state import ZombieSimulationState
+
+if TYPE_CHECKING:
+    from zombiotrack.models.state import ZombieSimulationState
+
+try:
+    # orjson is an optional speed-up for parsing large state files.
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 
 def get_state_filepath(session_id: str | None, state_file: str | None) -> Path:
@@ -20,11 +28,15 @@ def get_state_filepath(session_id: str | None, state_file: str | None) -> Path:
     return session_folder / "zombie-simulation-state.json"
 
 
-def load_state(session_id: str | None, state_file: str | None) -> ZombieSimulationState:
+def load_state(
+    session_id: str | None, state_file: str | None
+) -> "ZombieSimulationState":
     """
     Loads the simulation state from a file. If session_id is provided,
     the state file is assumed to be in sessions/<session_id>/zombie-simulation-state.json.
     """
+    from zombiotrack.models.state import ZombieSimulationState
+
     if not session_id and not state_file:
         echo("You must provide either a session ID or a state file path.")
         raise Exit()
@@ -33,14 +45,16 @@ def load_state(session_id: str | None, state_file: str | None) -> ZombieSimulati
         echo(f"State file '{filepath}' does not exist. Please run 'configure' first.")
         raise Exit()
 
-    return ZombieSimulationState(**json.loads(filepath.read_text()), strict=True)
+    return ZombieSimulationState(**json_loads(filepath.read_bytes()))
 
 
 def save_state(
-    session_id: str | None, state_file: str | None, state: ZombieSimulationState
+    session_id: str | None, state_file: str | None, state: "ZombieSimulationState"
 ) -> None:
     """
     Saves the simulation state to the appropriate file.
+    The JSON is written without indentation, which roughly halves the file
+    size on large buildings; use `visualize show-state` for a readable view.
     """
     filepath = get_state_filepath(session_id, state_file)
-    filepath.write_text(state.model_dump_json(indent=2, warnings="error"))
+    filepath.write_text(state.model_dump_json(warnings="error"))
@@ -1,12 +1,51 @@
 import json
-from rich.table import Table
-from rich.console import Console
+from functools import lru_cache
+from typing import TYPE_CHECKING
 from typer import Option, echo, Typer
 from zombiotrack.interfaces.cli.utils.data_management import load_state
-from zombiotrack.models.state import ZombieSimulationState
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from zombiotrack.models.state import ZombieSimulationState
 
 visualization_app = Typer(help="Command group for visualization porpouses")
 
+# Rich markup tags for each (sensor status, blocked) combination; blocked rooms
+# are always blue regardless of the sensor.
+_TAGS = {
+    ("normal", False): ("[bold green]", "[/bold green]"),
+    ("alert", False): ("[bold red]", "[/bold red]"),
+    ("normal", True): ("[blue]", "[/blue]"),
+    ("alert", True): ("[blue]", "[/blue]"),
+}
+
+
+@lru_cache(maxsize=1)
+def get_console() -> "Console":
+    """
+    Return the process-wide Rich console, creating it on first use.
+
+    Rich is imported here rather than at module level so commands that never
+    draw anything (``--help``, ``show-state``) do not pay for it, and terminal
+    and color-system detection happen once per process.
+
+    Returns
+    -------
+    Console
+        The shared Rich console.
+    """
+    from rich.console import Console
+
+    return Console()
+
+
+@lru_cache(maxsize=32)
+def _room_headers(rooms_count: int) -> tuple[str, ...]:
+    """
+    Column headers for a floor with `rooms_count` contiguously numbered rooms.
+    """
+    return tuple(f"Room {room_number}" for room_number in range(rooms_count))
+
 
 def get_color(sensor_status: str, blocked: bool = False) -> str:
     """
@@ -33,7 +72,7 @@ def get_color(sensor_status: str, blocked: bool = False) -> str:
     return f"bold {base}"
 
 
-def render_grid(state: ZombieSimulationState) -> None:
+def render_grid(state: "ZombieSimulationState") -> None:
     """
     Render the current building state as a colored grid in the console.
 
@@ -56,37 +95,35 @@ def render_grid(state: ZombieSimulationState) -> None:
     None
         This function outputs the table directly to the console using Rich.
     """
+    from rich.table import Table
+
     building = state.building  # instance of Building
-    floors = building.floors  # assumed to be a list of Floor objects
-    infected = state.infected_coords  # keys are now tuples thanks to the validator
+    floors = building.floors  # list of Floor objects
 
     table = Table(title="Zombie Simulation Grid", show_lines=True)
     table.add_column("Floor", justify="center")
-    # Assume each floor has the same rooms; get room numbers from the first floor.
-    if floors:
-        first_floor = floors[0]
-        room_numbers = [room for room in first_floor.rooms]
-    else:
-        room_numbers = []
-    for rn in room_numbers:
-        table.add_column(f"Room {rn}", justify="center")
-
-    for floor in floors.values():
-        row = [str(floor.floor_number)]
-        for room in floor.rooms.values():
-            key = (floor.floor_number, room.room_number)
-            info = infected.get(key, {})
-            zombie_count = info.get("zombie_count", 0)
-            sensor_status = room.sensor.status  # directly from the Room's sensor
-            style = get_color(sensor_status, blocked=room.blocked)
-            final_text = f"{zombie_count}"
+    # Assume each floor has the same rooms; size the header from the first floor.
+    rooms_count = len(floors[0].rooms) if floors else 0
+    for header in _room_headers(rooms_count):
+        table.add_column(header, justify="center")
+
+    # One grid per render, so each cell is a plain list index.
+    zombie_counts = state.zombie_count_grid()
+    for floor in floors:
+        row = [None] * (len(floor.rooms) + 1)
+        row[0] = str(floor.floor_number)
+        floor_counts = zombie_counts[floor.floor_number]
+        for idx, room in enumerate(floor.rooms, start=1):
+            zombie_count = floor_counts[room.room_number]
+            open_tag, close_tag = _TAGS[(room.sensor.status, room.blocked)]
+            # Blocked rooms show their count in brackets.
             if room.blocked:
-                final_text = f"[{zombie_count}]"
-            cell_text = f"[{style}]{final_text}[/{style}]"
-            row.append(cell_text)
+                row[idx] = f"{open_tag}[{zombie_count}]{close_tag}"
+            else:
+                row[idx] = f"{open_tag}{zombie_count}{close_tag}"
         table.add_row(*row)
 
-    Console().print(table)
+    get_console().print(table)
 
 
 @visualization_app.command()
@@ -145,10 +182,17 @@ def show_state(
         Prints the selected portion of the state as formatted JSON.
     """
     state = load_state(session_id, state_file)
-    json_state = state.model_dump_json(indent=2)
+    # Serialize once and walk the plain data instead of re-parsing per path part.
+    node = state.model_dump(mode="json")
     path_parts = json_path.split(".") if json_path else []
     for part in path_parts:
-        if part == "$":
+        if part in ("", "$"):
             continue
-        json_state = json.dumps(json.loads(json_state).get(part, {}), indent=2)
-    echo(json_state)
+        if isinstance(node, list):
+            # Floors and rooms are lists, so path parts index them by position.
+            node = node[int(part)] if part.isdigit() and int(part) < len(node) else {}
+        elif isinstance(node, dict):
+            node = node.get(part, {})
+        else:
+            node = {}
+    echo(json.dumps(node, indent=2))
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 from zombiotrack.models.floor import Floor
 from zombiotrack.models.room import Room
@@ -33,12 +33,23 @@ class Building(BaseModel):
     )
     "Number of rooms per floor."
 
-    floors: dict[int, Floor] = Field(
+    floors: list[Floor] = Field(
         default_factory=list,
         description="List of Floor objects in the building.",
     )
     "List of Floor objects in the building."
 
+    @field_validator("floors", mode="before")
+    @classmethod
+    def convert_floors_mapping(cls, value):
+        """
+        Accepts the legacy mapping of floor number to floor (e.g. {"0": {...}})
+        used by older state files, ordering it by floor number.
+        """
+        if isinstance(value, dict):
+            return [value[key] for key in sorted(value, key=int)]
+        return value
+
     @model_validator(mode="after")
     def validate_floors(self) -> "Building":
         if len(self.floors) > self.floors_count:
@@ -68,17 +79,16 @@ class Building(BaseModel):
         Building
             A Building object with the specified floors and rooms.
         """
-        floors: dict[int, Floor] = {}
-
-        for floor_number in range(floors_count):
-            floor = Floor(floor_number=floor_number)
-            for room_number in range(rooms_per_floor):
-                new_room = Room(
-                    room_number=room_number,
-                    sensor=Sensor(),
-                )
-                floor.rooms[room_number] = new_room
-            floors[floor_number] = floor
+        floors = [
+            Floor(
+                floor_number=floor_number,
+                rooms=[
+                    Room(room_number=room_number, sensor=Sensor())
+                    for room_number in range(rooms_per_floor)
+                ],
+            )
+            for floor_number in range(floors_count)
+        ]
 
         return cls(
             floors_count=floors_count,
@@ -94,6 +104,10 @@ class Building(BaseModel):
         """
         Update the building size by adding or removing floors and rooms.
 
+        New floor and room lists are built instead of resizing the current ones,
+        and resized floors are copied, because simulation states share unchanged
+        floors and rooms with each other.
+
         Parameters
         ----------
         new_floors_count : int
@@ -101,32 +115,34 @@ class Building(BaseModel):
         new_rooms_per_floor : int
             New number of rooms per floor.
         """
-        if new_floors_count < self.floors_count:
-            self.floors = {k: v for k, v in self.floors.items() if k < new_floors_count}
-        elif new_floors_count > self.floors_count:
-            for floor_number in range(self.floors_count, new_floors_count):
-                floor = Floor(floor_number=floor_number)
-                for room_number in range(new_rooms_per_floor):
-                    new_room = Room(
-                        room_number=room_number,
-                        sensor=Sensor(),
-                    )
-                    floor.rooms[room_number] = new_room
-                self.floors[floor_number] = floor
+        floors = self.floors[:new_floors_count]
+        floors.extend(
+            Floor(
+                floor_number=floor_number,
+                rooms=[
+                    Room(room_number=room_number, sensor=Sensor())
+                    for room_number in range(self.rooms_per_floor)
+                ],
+            )
+            for floor_number in range(self.floors_count, new_floors_count)
+        )
 
         if new_rooms_per_floor != self.rooms_per_floor:
-            for floor in self.floors.values():
-                if new_rooms_per_floor < self.rooms_per_floor:
-                    floor.rooms = {
-                        k: v for k, v in floor.rooms.items() if k < new_rooms_per_floor
+            floors = [
+                floor.model_copy(
+                    update={
+                        "rooms": floor.rooms[:new_rooms_per_floor]
+                        + [
+                            Room(room_number=room_number, sensor=Sensor())
+                            for room_number in range(
+                                self.rooms_per_floor, new_rooms_per_floor
+                            )
+                        ]
                     }
-                elif new_rooms_per_floor > self.rooms_per_floor:
-                    for room_number in range(self.rooms_per_floor, new_rooms_per_floor):
-                        new_room = Room(
-                            room_number=room_number,
-                            sensor=Sensor(),
-                        )
-                        floor.rooms[room_number] = new_room
+                )
+                for floor in floors
+            ]
 
+        self.floors = floors
         self.floors_count = new_floors_count
         self.rooms_per_floor = new_rooms_per_floor
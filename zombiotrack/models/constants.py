@@ -0,0 +1,3 @@
+# Infection attributes
+
+ZOMBIE_COUNT = "zombie_count"
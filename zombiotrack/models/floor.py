@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 from zombiotrack.models.room import Room
 
@@ -22,8 +22,19 @@ class Floor(BaseModel):
     )
     "The floor index (e.g., 0 for ground floor)."
 
-    rooms: dict[int, Room] = Field(
-        default_factory=dict,
+    rooms: list[Room] = Field(
+        default_factory=list,
         description="List of Room objects on this floor.",
     )
     "List of Room objects on this floor."
+
+    @field_validator("rooms", mode="before")
+    @classmethod
+    def convert_rooms_mapping(cls, value):
+        """
+        Accepts the legacy mapping of room number to room (e.g. {"0": {...}})
+        used by older state files, ordering it by room number.
+        """
+        if isinstance(value, dict):
+            return [value[key] for key in sorted(value, key=int)]
+        return value
@@ -1,23 +1,26 @@
-from pydantic import BaseModel, Field
+from dataclasses import dataclass, field
 from typing import Literal
 
 INITIAL_STATE = "normal"
 
 
-class Sensor(BaseModel):
+@dataclass(slots=True)
+class Sensor:
     """
     Represents an IoT sensor with a current status.
 
+    A slotted dataclass rather than a ``BaseModel``: every room owns one, so
+    keeping it free of per-instance ``__dict__`` and pydantic bookkeeping keeps
+    large buildings small. Pydantic still validates and serializes it as a
+    ``{"status": ...}`` mapping when it is nested in a ``Room``.
+
     Parameters
     ----------
     status : Literal['normal', 'alert']
         The current state of the sensor.
     """
 
-    status: Literal["normal", "alert"] = Field(
-        INITIAL_STATE,
-        description="The current state of the sensor.",
-    )
+    status: Literal["normal", "alert"] = field(default=INITIAL_STATE)
     "The current state of the sensor."
 
     def reset(self):
@@ -1,10 +1,22 @@
 from pydantic import BaseModel, Field, model_validator
 
 from zombiotrack.models.building import Building
+from zombiotrack.models.constants import ZOMBIE_COUNT
 
 InfectionState = dict[tuple[int, int], dict[str, str | int]]
 
 
+def _has_tuple_keys(mapping: object) -> bool:
+    """
+    Whether a coordinate mapping already uses tuple keys, judged by its first key.
+    """
+    return (
+        isinstance(mapping, dict)
+        and bool(mapping)
+        and isinstance(next(iter(mapping)), tuple)
+    )
+
+
 class ZombieSimulationState(BaseModel):
     """
     Represents the current state of the zombie simulation, including
@@ -59,9 +71,13 @@ class ZombieSimulationState(BaseModel):
         """
         Converts string keys in 'infected_coords' (e.g., "1,2") into tuple keys (1, 2)
         before validation.
+
+        Keys come either all as strings (loaded from JSON) or all as tuples
+        (built in Python), so the first key decides whether a mapping needs
+        converting at all.
         """
         mapping = data.get("infected_coords")
-        if mapping and isinstance(mapping, dict):
+        if mapping and isinstance(mapping, dict) and not _has_tuple_keys(mapping):
             new_mapping = {}
             for key, value in mapping.items():
                 if isinstance(key, str):
@@ -77,7 +93,7 @@ class ZombieSimulationState(BaseModel):
                 new_mapping[new_key] = value
             data["infected_coords"] = new_mapping
         logs = data.get("infection_events_log")
-        if logs and isinstance(logs, list):
+        if logs and isinstance(logs, list) and not _has_tuple_keys(logs[0]):
             new_logs = []
             for log in logs:
                 new_log = {}
@@ -96,3 +112,69 @@ class ZombieSimulationState(BaseModel):
                 new_logs.append(new_log)
             data["infection_events_log"] = new_logs
         return data
+
+    @model_validator(mode="after")
+    def check_infected_rooms(self) -> "ZombieSimulationState":
+        """
+        Checks that every infected room lies inside the building.
+
+        Raises
+        ------
+        ValueError
+            If an infected room lies outside the building.
+        """
+        floors = self.building.floors
+        for floor, room in self.infected_coords:
+            if not (0 <= floor < len(floors) and 0 <= room < len(floors[floor].rooms)):
+                raise ValueError(
+                    f"Infected room ({floor}, {room}) is outside the building."
+                )
+        return self
+
+    def zombie_count_grid(self) -> list[list[int]]:
+        """
+        Build the dense floor-by-room grid of zombie counts.
+
+        A new grid is built from `infected_coords` on every call, so it is never
+        stale after in-place edits or `model_copy`. Build it once per pass over
+        the building (a turn, a render) and index it per room.
+
+        Returns
+        -------
+        list[list[int]]
+            The zombie count of every room, indexed by floor then room.
+
+        Raises
+        ------
+        ValueError
+            If an infected room lies outside the building.
+        """
+        counts = [[0] * len(floor.rooms) for floor in self.building.floors]
+        for (floor, room), attributes in self.infected_coords.items():
+            if not (0 <= floor < len(counts) and 0 <= room < len(counts[floor])):
+                raise ValueError(
+                    f"Infected room ({floor}, {room}) is outside the building."
+                )
+            counts[floor][room] = attributes.get(ZOMBIE_COUNT, 0)
+        return counts
+
+    def zombie_count_at(self, floor: int, room: int) -> int:
+        """
+        Get the number of zombies in a room.
+
+        Parameters
+        ----------
+        floor : int
+            The floor number.
+        room : int
+            The room number.
+
+        Returns
+        -------
+        int
+            The zombie count of the room, 0 if it is not infected.
+        """
+        room_infection = self.infected_coords.get((floor, room))
+        if room_infection is None:
+            return 0
+        return room_infection.get(ZOMBIE_COUNT, 0)
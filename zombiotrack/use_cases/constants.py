@@ -1,10 +1,15 @@
+# ZOMBIE_COUNT is defined with the models that store it and re-exported here.
+from zombiotrack.models.constants import ZOMBIE_COUNT as ZOMBIE_COUNT
+
 # Actions
 DO_NOTHING = 0
 
 # Infection attributes
-
-ZOMBIE_COUNT = "zombie_count"
 ZOMBIE_COUNT_DELTA = "zombie_count_delta"
 
 # Infection parameters
 INFECTION_PROBABILITY = 0.5
+
+# Infection events log
+# Most recent infection actions kept on the state; older entries are dropped.
+INFECTION_EVENTS_LOG_CAPACITY = 10_000
@@ -1,16 +1,42 @@
+from collections.abc import Callable, Iterable
 from copy import deepcopy
-from random import random, randint
+from dataclasses import dataclass, replace
+from random import Random
 from zombiotrack.models.building import Building
-from zombiotrack.models.floor import Floor
+from zombiotrack.models.room import Room
 from zombiotrack.models.state import InfectionState, ZombieSimulationState
 from zombiotrack.use_cases.constants import (
     DO_NOTHING,
+    INFECTION_EVENTS_LOG_CAPACITY,
     INFECTION_PROBABILITY,
     ZOMBIE_COUNT,
     ZOMBIE_COUNT_DELTA,
 )
 
 
+@dataclass(slots=True)
+class StepResult:
+    """
+    What changed during one simulation turn.
+
+    Returned by `ZombieEnvironment.advance`, which updates the environment's
+    state in place instead of producing a new state for every turn.
+
+    Parameters
+    ----------
+    turn : int
+        The turn number reached.
+    deltas : dict[tuple[int, int], int]
+        The net zombie count change of every room touched this turn.
+    triggered : set[tuple[int, int]]
+        The rooms that received zombies this turn, whose sensors alerted.
+    """
+
+    turn: int
+    deltas: dict[tuple[int, int], int]
+    triggered: set[tuple[int, int]]
+
+
 class ZombieEnvironment:
     """
     A simulation environment for a zombie invasion.
@@ -22,19 +48,49 @@ class ZombieEnvironment:
     god_mode) modify the environment directly via CLI commands.
 
     The environment stores its current state in `self.state`, and every method returns
-    a new, updated state.
+    a new, updated state. Consecutive states share the floors and rooms that did
+    not change, so a produced state must be treated as read-only: change rooms
+    through the environment methods, which copy what they modify.
     """
 
-    def __init__(self, initial_state: ZombieSimulationState, stochastic: bool = False):
+    # `self.state` and friends are read on every turn; slots keep those reads
+    # on fixed-offset descriptors instead of an instance dictionary.
+    __slots__ = (
+        "_neighbors",
+        "_neighbors_mask",
+        "_rng",
+        "events_log_capacity",
+        "state",
+        "step_action_lookup",
+        "stochastic",
+    )
+
+    def __init__(
+        self,
+        initial_state: ZombieSimulationState,
+        stochastic: bool = False,
+        seed: int | None = None,
+        events_log_capacity: int | None = INFECTION_EVENTS_LOG_CAPACITY,
+    ):
         # Store the current state of the simulation.
         self.state = deepcopy(initial_state)
-        # Lookup table: number -> action name, default action (0) is "do_nothing"
-        self.step_action_lookup = {
-            DO_NOTHING: "do_nothing",  # Default action
+        # Lookup table: number -> step-level handler, default action (0) is `do_nothing`.
+        # Handlers are stored directly so dispatching a step needs no getattr.
+        self.step_action_lookup: dict[
+            int, Callable[[ZombieSimulationState], ZombieSimulationState]
+        ] = {
+            DO_NOTHING: self.do_nothing,  # Default action
             # Future step-level actions can agregate more mappings.
         }
 
         self.stochastic: bool = stochastic
+        # Per-environment generator so stochastic runs can be reproduced with `seed`.
+        self._rng = Random(seed)
+        # Bound on `infection_events_log` entries, None keeps the full history.
+        self.events_log_capacity = events_log_capacity
+        # Open neighbours of every room, keyed by the blocked mask they were built from.
+        self._neighbors: list[list[tuple[tuple[int, int], ...]]] = []
+        self._neighbors_mask: list[list[bool]] | None = None
         self._simulation_initialization()
 
     def _simulation_initialization(self):
@@ -50,6 +106,73 @@ class ZombieEnvironment:
                 # Sending messages to the initial sensors triggers
                 self.state.building.floors[floor].rooms[room].sensor.trigger()
 
+    def _clone_state(self, state: ZombieSimulationState) -> ZombieSimulationState:
+        """
+        Copy a state so it can be mutated without affecting the original.
+
+        Only the containers the environment mutates in place are copied: the
+        infection mapping with its per-room attribute dicts, and the events log.
+        The building is shared with the original until `_own_rooms` swaps in
+        private copies of the rooms about to change.
+
+        Parameters
+        ----------
+        state : ZombieSimulationState
+            The state to copy.
+
+        Returns
+        -------
+        ZombieSimulationState
+            A copy that shares every unmodified room with `state`.
+        """
+        new_state = state.model_copy()
+        new_state.infected_coords = {
+            coords: attributes.copy()
+            for coords, attributes in state.infected_coords.items()
+        }
+        new_state.infection_events_log = state.infection_events_log.copy()
+        return new_state
+
+    def _own_rooms(
+        self, state: ZombieSimulationState, coords: Iterable[tuple[int, int]]
+    ) -> dict[tuple[int, int], Room]:
+        """
+        Replace the given rooms of `state` with private copies and return them.
+
+        Only the path to each room is copied (building, floor list, the floor,
+        its room list, the room and its sensor), so the returned rooms can be
+        mutated without touching states that share the rest of the building.
+
+        Parameters
+        ----------
+        state : ZombieSimulationState
+            The state whose rooms are about to change, usually a `_clone_state` copy.
+        coords : Iterable[tuple[int, int]]
+            The (floor, room) coordinates of the rooms to copy.
+
+        Returns
+        -------
+        dict[tuple[int, int], Room]
+            The copied rooms, keyed by their coordinates.
+        """
+        building = state.building.model_copy()
+        building.floors = floors = building.floors.copy()
+        owned_floors = {}
+        owned_rooms: dict[tuple[int, int], Room] = {}
+        for floor, room in coords:
+            if (floor, room) in owned_rooms:
+                continue
+            target_floor = owned_floors.get(floor)
+            if target_floor is None:
+                target_floor = floors[floor].model_copy()
+                target_floor.rooms = target_floor.rooms.copy()
+                floors[floor] = owned_floors[floor] = target_floor
+            new_room = target_floor.rooms[room].model_copy()
+            new_room.sensor = replace(new_room.sensor)
+            target_floor.rooms[room] = owned_rooms[(floor, room)] = new_room
+        state.building = building
+        return owned_rooms
+
     def _apply_update(
         self,
         state: ZombieSimulationState,
@@ -59,6 +182,11 @@ class ZombieEnvironment:
         """
         Helper to update the state's last_action and log the new state snapshot.
 
+        Every mutation of the state funnels through here, so this is also where
+        the dense zombie count grid is brought back in sync with `infected_coords`.
+        The caller must pass a state it owns (already copied from `self.state`);
+        it becomes the environment's current state without being copied again.
+
         Parameters
         ----------
         state : ZombieSimulationState
@@ -73,7 +201,7 @@ class ZombieEnvironment:
         """
         state.last_action = action
         state.last_action_payload = payload
-        self.state = deepcopy(state)
+        self.state = state
         return state
 
     def step(self, action: int = 0) -> ZombieSimulationState:
@@ -82,11 +210,14 @@ class ZombieEnvironment:
         and applies an additional step-level action from the lookup table.
 
         The simulation state is stored internally (self.state) and updated in-place.
+        The current state is copied exactly once per turn; the returned state is
+        the one stored in `self.state`.
 
         Parameters
         ----------
-        step_action : int, optional
+        action : int, optional
             The number representing a step-level action to apply (default is 0, "do_nothing").
+            Unknown numbers fall back to "do_nothing".
 
         Returns
         -------
@@ -94,40 +225,103 @@ class ZombieEnvironment:
             The new simulation state after advancing one turn.
         """
 
-        new_state = deepcopy(self.state)
-        new_state.turn += 1
+        self._advance(self._clone_state(self.state), action)
+        return self.state
+
+    def advance(self, action: int = DO_NOTHING) -> StepResult:
+        """
+        Advances the simulation by one turn, updating `self.state` in place.
+
+        Unlike `step`, the current state is not copied, so any reference to it
+        observes the new turn; use `snapshot` to keep a copy of a given turn.
+
+        Parameters
+        ----------
+        action : int, optional
+            The number representing a step-level action to apply (default is 0, "do_nothing").
+
+        Returns
+        -------
+        StepResult
+            The turn reached and the rooms changed during it.
+        """
+        return self._advance(self.state, action)
+
+    def snapshot(self) -> ZombieSimulationState:
+        """
+        Copy the current state so later turns do not affect it.
+
+        Returns
+        -------
+        ZombieSimulationState
+            A copy of `self.state`.
+        """
+        return self._clone_state(self.state)
+
+    def _advance(self, state: ZombieSimulationState, action: int) -> StepResult:
+        """
+        Advances `state` by one turn in place and makes it the current state.
+
+        Parameters
+        ----------
+        state : ZombieSimulationState
+            The state to advance, owned by the caller.
+        action : int
+            The number representing a step-level action to apply.
+
+        Returns
+        -------
+        StepResult
+            The turn reached and the rooms changed during it.
+        """
+        state.turn += 1
 
         # Apply the default action if the action number is not in the lookup table.
-        if action != 0 and action not in self.step_action_lookup:
-            action_name = self.step_action_lookup.get(action, "do_nothing")
-            new_state = getattr(self, action_name)(new_state)
+        handler = self.step_action_lookup.get(action, self.do_nothing)
+        state = handler(state)
 
         # Apply the infection spread.
-        new_state = self._spread_infection(new_state)
-
-        return new_state
+        return self._spread_infection(state)
 
-    def _room_is_blocked(
-        self, state: ZombieSimulationState, floor: int, room: int
-    ) -> bool:
+    def do_nothing(self, state: ZombieSimulationState) -> ZombieSimulationState:
         """
-        Checks if a room is blocked.
+        Default step-level action: leave the state as it is.
 
         Parameters
         ----------
         state : ZombieSimulationState
-            The current simulation state.
-        floor : int
-            The floor number.
-        room : int
-            The room number.
+            The state being advanced by `step`.
 
         Returns
         -------
-        bool
-            True if the room is blocked, False otherwise.
+        ZombieSimulationState
+            The same state, unchanged.
         """
-        return state.building.floors[floor].rooms[room].blocked
+        return state
+
+    def multi_step(self, steps: int, action: int = DO_NOTHING) -> ZombieSimulationState:
+        """
+        Advances the simulation by several turns in a row.
+
+        Equivalent to calling `step` `steps` times, but the state is copied only
+        once, up front, and then advanced in place turn after turn.
+
+        Parameters
+        ----------
+        steps : int
+            The number of turns to advance.
+        action : int, optional
+            The step-level action applied on every turn (default is 0, "do_nothing").
+
+        Returns
+        -------
+        ZombieSimulationState
+            The simulation state after the last turn.
+        """
+        self.state = self._clone_state(self.state)
+        for _ in range(steps):
+            self.advance(action)
+        return self.state
 
     def _assert_bounds(
         self, state: ZombieSimulationState, floor: int, room: int
@@ -158,16 +352,15 @@ class ZombieEnvironment:
         if room < 0 or room >= len(state.building.floors[floor].rooms):
             raise ValueError("Invalid starting room number.")
 
-    def _check_room_exists(
-        self, state: ZombieSimulationState, floor: int, room: int
-    ) -> bool:
+    @staticmethod
+    def _is_open_room(blocked_mask: list[list[bool]], floor: int, room: int) -> bool:
         """
-        Check if a room exists in the building.
+        Check against a blocked mask that a room exists and is not blocked.
 
         Parameters
         ----------
-        state : ZombieSimulationState
-            The current simulation state.
+        blocked_mask : list[list[bool]]
+            Grid of blocked flags as returned by `_blocked_mask`.
         floor : int
             The floor number.
         room : int
@@ -176,132 +369,194 @@ class ZombieEnvironment:
         Returns
         -------
         bool
-            True if the room exists, False otherwise.
+            True if the room is inside the grid and not blocked, False otherwise.
         """
-        floor_instance: Floor | None = state.building.floors.get(floor)
-        if floor_instance is None:
-            return False
-        return room in floor_instance.rooms
+        return (
+            0 <= floor < len(blocked_mask)
+            and 0 <= room < len(blocked_mask[floor])
+            and not blocked_mask[floor][room]
+        )
 
-    def _check_bounds(
-        self, state: ZombieSimulationState, floor: int, room: int
-    ) -> bool:
+    def _blocked_mask(self, state: ZombieSimulationState) -> list[list[bool]]:
         """
-        Check if the given floor and room numbers are within the building bounds.
+        Build a dense floor-by-room grid of the blocked flag of every room.
+
+        The grid is built once per turn so the spread loop can check neighbors
+        with plain list indexing instead of walking the Pydantic models.
 
         Parameters
         ----------
         state : ZombieSimulationState
             The current simulation state.
-        floor : int
-            The floor number.
-        room : int
-            The room number.
 
         Returns
         -------
-        bool
-            True if the floor and room numbers are within bounds, False otherwise.
+        list[list[bool]]
+            ``mask[floor][room]`` is True if the room is blocked.
         """
-        return 0 <= floor < len(state.building.floors) and 0 <= room < len(
-            state.building.floors[floor].rooms
-        )
+        return [
+            [room.blocked for room in floor.rooms] for floor in state.building.floors
+        ]
 
-    def _check_infected(
-        self, state: ZombieSimulationState, floor: int, room: int
-    ) -> bool:
+    def _neighbor_table(
+        self, blocked_mask: list[list[bool]]
+    ) -> list[list[tuple[tuple[int, int], ...]]]:
         """
-        Check if a room is infected.
+        Get the open (unblocked) neighbours of every room.
+
+        The table only depends on the building layout and the blocked flags, so
+        it is rebuilt only when `blocked_mask` differs from the mask it was last
+        built from (after a block/unblock or a resize), and reused otherwise.
 
         Parameters
         ----------
-        state : ZombieSimulationState
-            The current simulation state.
-        floor : int
-            The floor number.
-        room : int
-            The room number.
+        blocked_mask : list[list[bool]]
+            Grid of blocked flags as returned by `_blocked_mask`.
 
         Returns
         -------
-        bool
-            True if the room is infected, False otherwise.
-        """
-        if state.infected_coords[(floor, room)].get(ZOMBIE_COUNT, 0) == 0:
-            return False
-        return True
-
-    def _spread_infection(self, state: ZombieSimulationState) -> ZombieSimulationState:
+        list[list[tuple[tuple[int, int], ...]]]
+            ``table[floor][room]`` holds the coordinates of the open rooms
+            adjacent to that room.
+        """
+        if blocked_mask == self._neighbors_mask:
+            return self._neighbors
+
+        is_open = self._is_open_room
+        table = []
+        for floor, floor_mask in enumerate(blocked_mask):
+            floor_neighbors = []
+            for room in range(len(floor_mask)):
+                # The von Neumann neighbourhood: below, left, right and above.
+                adjacent_rooms = []
+                if is_open(blocked_mask, floor - 1, room):
+                    adjacent_rooms.append((floor - 1, room))
+                if is_open(blocked_mask, floor, room - 1):
+                    adjacent_rooms.append((floor, room - 1))
+                if is_open(blocked_mask, floor, room + 1):
+                    adjacent_rooms.append((floor, room + 1))
+                if is_open(blocked_mask, floor + 1, room):
+                    adjacent_rooms.append((floor + 1, room))
+                floor_neighbors.append(tuple(adjacent_rooms))
+            table.append(floor_neighbors)
+
+        self._neighbors = table
+        self._neighbors_mask = blocked_mask
+        return table
+
+    def _spread_infection(self, state: ZombieSimulationState) -> StepResult:
         """
         Spreads the infection to adjacent rooms.
 
+        The given state is updated in place and becomes `self.state`, so it must
+        be owned by the caller (see `step` and `advance`).
+
         Parameters
         ----------
         state : ZombieSimulationState
-            The current simulation state.
+            The simulation state to advance.
 
         Returns
         -------
-        ZombieSimulationState
-            The new simulation state after spreading the infection.
+        StepResult
+            The turn reached and the rooms changed while spreading.
         """
-        new_state = deepcopy(state)
+        blocked_mask = self._blocked_mask(state)
+        zombie_counts = state.zombie_count_grid()
+        neighbors = self._neighbor_table(blocked_mask)
+        rng = self._rng
         infection_actions: list[InfectionState] = []
         for floor, room in state.infected_coords:
-            if self._check_infected(
-                new_state, floor, room
-            ) and not self._room_is_blocked(new_state, floor, room):
+            if zombie_counts[floor][room] != 0 and not blocked_mask[floor][room]:
                 room_infection_actions = self._spread_infection_room(
-                    new_state, floor, room
+                    state, floor, room, blocked_mask, zombie_counts, neighbors, rng
                 )
                 infection_actions.extend(room_infection_actions)
+        deltas: dict[tuple[int, int], int] = {}
+        triggered: set[tuple[int, int]] = set()
         for infection_action in infection_actions:
-            new_state = self._apply_infection_action(new_state, infection_action)
-        new_state.infection_events_log += infection_actions
-        new_state = self._apply_update(
-            state=new_state,
+            for coords, attributes in infection_action.items():
+                value = attributes.get(ZOMBIE_COUNT_DELTA, 0)
+                deltas[coords] = deltas.get(coords, 0) + value
+                if value > 0:
+                    triggered.add(coords)
+        applied = self._apply_infection_deltas(state, deltas, triggered)
+        events_log = state.infection_events_log
+        events_log += infection_actions
+        capacity = self.events_log_capacity
+        if capacity is not None and len(events_log) > capacity:
+            # Keep only the most recent entries so the log (and every copy of
+            # it) stops growing with the number of turns.
+            del events_log[: len(events_log) - capacity]
+        self._apply_update(
+            state=state,
             action="spread_infection",
             payload={
                 "stochastic": self.stochastic,
             },
         )
-        return new_state
+        return StepResult(turn=state.turn, deltas=applied, triggered=triggered)
 
-    def _apply_infection_action(
-        self, state: ZombieSimulationState, infection_action: InfectionState
-    ) -> ZombieSimulationState:
+    def _apply_infection_deltas(
+        self,
+        state: ZombieSimulationState,
+        deltas: dict[tuple[int, int], int],
+        triggered: set[tuple[int, int]],
+    ) -> dict[tuple[int, int], int]:
         """
-        Applies an infection action to the current state. Also sends messages to
-        teh required devices if is required.
+        Applies the summed zombie count changes of a turn to the state in place.
+        Also sends messages to the required devices if is required.
+
+        All deltas of a turn are summed per room before being applied, so the
+        result does not depend on the order the rooms were processed in. Counts
+        are clamped at zero, so the applied change can be smaller than the sum.
 
         Parameters
         ----------
         state : ZombieSimulationState
             The current simulation state.
-        infection_action : InfectionState
-            The infection action to apply.
+        deltas : dict[tuple[int, int], int]
+            The summed zombie count change of every room touched this turn.
+        triggered : set[tuple[int, int]]
+            The rooms that received zombies this turn, whose sensors must alert.
 
         Returns
         -------
-        ZombieSimulationState
-            The new simulation state after applying the infection action.
-        """
-        for room, attributes in infection_action.items():
-            if room not in state.infected_coords:
-                state.infected_coords[room] = {}
-            for attribute, value in attributes.items():
-                if attribute == ZOMBIE_COUNT_DELTA:
-                    if value > 0:
-                        state.building.floors[room[0]].rooms[room[1]].sensor.trigger()
-                    if ZOMBIE_COUNT not in state.infected_coords[room]:
-                        state.infected_coords[room][ZOMBIE_COUNT] = 0
-                    state.infected_coords[room][ZOMBIE_COUNT] = max(
-                        0, state.infected_coords[room].get(ZOMBIE_COUNT, 0) + value
-                    )
-        return state
+        dict[tuple[int, int], int]
+            The net change actually applied to every touched room, after clamping.
+        """
+        infected_coords = state.infected_coords
+        applied: dict[tuple[int, int], int] = {}
+        for room, delta in deltas.items():
+            room_infection = infected_coords.get(room)
+            if room_infection is None:
+                room_infection = infected_coords[room] = {}
+            old_count = room_infection.get(ZOMBIE_COUNT, 0)
+            new_count = max(0, old_count + delta)
+            room_infection[ZOMBIE_COUNT] = new_count
+            applied[room] = new_count - old_count
+        # Rooms may be shared with the previous state, so the rooms whose sensor
+        # actually changes are copied together, in one pass over the building.
+        floors = state.building.floors
+        to_alert = [
+            (floor, room)
+            for floor, room in triggered
+            if floors[floor].rooms[room].sensor.status != "alert"
+        ]
+        if to_alert:
+            for owned_room in self._own_rooms(state, to_alert).values():
+                owned_room.sensor.trigger()
+        return applied
 
     def _spread_infection_room(
-        self, state: ZombieSimulationState, floor: int, room: int
+        self,
+        state: ZombieSimulationState,
+        floor: int,
+        room: int,
+        blocked_mask: list[list[bool]],
+        zombie_counts: list[list[int]],
+        neighbors: list[list[tuple[tuple[int, int], ...]]],
+        rng: Random,
     ) -> list[InfectionState]:
         """
         Spreads the infection to an adjacent room.
@@ -314,6 +569,14 @@ class ZombieEnvironment:
             The floor number.
         room : int
             The room number.
+        blocked_mask : list[list[bool]]
+            Grid of blocked flags as returned by `_blocked_mask`.
+        zombie_counts : list[list[int]]
+            Grid of zombie counts as returned by `ZombieSimulationState.zombie_count_grid`.
+        neighbors : list[list[tuple[tuple[int, int], ...]]]
+            Table of open neighbours as returned by `_neighbor_table`.
+        rng : Random
+            Random generator used by stochastic spreading, bound once per turn.
 
         Returns
         -------
@@ -321,58 +584,50 @@ class ZombieEnvironment:
             A list of InfectionState that would represent the actions taken over the `infected_coords` attribute.
         """
 
-        assert self._check_bounds(state, floor, room), "Invalid room coordinates."
-        assert self._check_room_exists(state, floor, room), "Room does not exist."
-        assert not self._room_is_blocked(state, floor, room), "Room is blocked."
+        # Checked against the grids so the sweep never walks the Pydantic models.
+        assert self._is_open_room(blocked_mask, floor, room), (
+            "Room does not exist or is blocked."
+        )
+
+        infection_power: int = zombie_counts[floor][room]
 
         # Check if the room is infected and has zombies.
-        if not self._check_infected(state, floor, room):
+        if infection_power == 0:
             return []
 
         # Get the list of adjacent rooms.
-        possible_adjacent_rooms: set[tuple[int, int]] = set()
-
-        for i in range(-1, 2):
-            for j in range(-1, 2):
-                if abs(i) + abs(j) != 1:
-                    continue
-                if (
-                    self._check_bounds(state, floor + i, room + j)
-                    and not self._room_is_blocked(state, floor + i, room + j)
-                    and self._check_room_exists(state, floor + i, room + j)
-                ):
-                    possible_adjacent_rooms.add((floor + i, room + j))
-
-        infection_place_state = state.infected_coords.get((floor, room), {})
-
-        infection_power: int = infection_place_state.get(ZOMBIE_COUNT, 1)
+        possible_adjacent_rooms = neighbors[floor][room]
 
         infection_status: int = 0
 
         infection_actions: list[InfectionState] = []
 
+        # Loop invariants, looked up once per infected room.
+        stochastic = self.stochastic
+        even_strength = max(infection_power // max(len(possible_adjacent_rooms), 1), 1)
+
         # Spread the infection to a random adjacent room.
         for adjacent_room in possible_adjacent_rooms:
-            if self.stochastic:
-                if random() < INFECTION_PROBABILITY:
-                    strength = randint(0, infection_power)
+            if stochastic:
+                if rng.random() < INFECTION_PROBABILITY:
+                    strength = rng.randint(0, infection_power)
                     infection_action = self._infect_room(
                         state,
                         adjacent_room[0],
                         adjacent_room[1],
                         quantity=strength,
+                        blocked_mask=blocked_mask,
                     )
                 else:
                     continue
             else:
-                strength = max(
-                    infection_power // max(len(possible_adjacent_rooms), 1), 1
-                )
+                strength = even_strength
                 infection_action = self._infect_room(
                     state,
                     adjacent_room[0],
                     adjacent_room[1],
                     quantity=strength,
+                    blocked_mask=blocked_mask,
                 )
             infection_status += strength
             infection_actions.append(infection_action)
@@ -389,7 +644,12 @@ class ZombieEnvironment:
         return infection_actions
 
     def _infect_room(
-        self, state: ZombieSimulationState, floor: int, room: int, quantity: int
+        self,
+        state: ZombieSimulationState,
+        floor: int,
+        room: int,
+        quantity: int,
+        blocked_mask: list[list[bool]],
     ) -> InfectionState:
         """
         Infects a room with zombies.
@@ -402,16 +662,18 @@ class ZombieEnvironment:
             The floor number.
         room : int
             The room number.
+        blocked_mask : list[list[bool]]
+            Grid of blocked flags as returned by `_blocked_mask`, which the room
+            is checked against instead of the building models.
 
         Returns
         -------
         InfectionState
             An instance of the InfectionState that would represent an action over the `infected_coords` attribute.
         """
-
-        assert self._check_bounds(state, floor, room), "Invalid room coordinates."
-        assert self._check_room_exists(state, floor, room), "Room does not exist."
-        assert not self._room_is_blocked(state, floor, room), "Room is blocked."
+        assert self._is_open_room(blocked_mask, floor, room), (
+            "Room does not exist or is blocked."
+        )
         return {
             (floor, room): {
                 ZOMBIE_COUNT_DELTA: quantity,
@@ -434,10 +696,9 @@ class ZombieEnvironment:
         ZombieSimulationState
             The new simulation state after cleaning the room.
         """
-        new_state = deepcopy(self.state)
+        new_state = self._clone_state(self.state)
         self._assert_bounds(new_state, floor, room)
-        deleted = new_state.infected_coords.pop((floor, room), None)
-        print(deleted)
+        new_state.infected_coords.pop((floor, room), None)
         new_state = self._apply_update(
             new_state,
             "clean_room",
@@ -446,7 +707,6 @@ class ZombieEnvironment:
                 "room": room,
             },
         )
-        self.state = deepcopy(new_state)
         return new_state
 
     def reset_sensor(self, floor: int, room: int) -> ZombieSimulationState:
@@ -465,9 +725,9 @@ class ZombieEnvironment:
         ZombieSimulationState
             The new simulation state after resetting the sensor.
         """
-        new_state = deepcopy(self.state)
+        new_state = self._clone_state(self.state)
         self._assert_bounds(new_state, floor, room)
-        new_state.building.floors[floor].rooms[room].sensor.reset()
+        self._own_rooms(new_state, [(floor, room)])[(floor, room)].sensor.reset()
         new_state = self._apply_update(
             new_state,
             "reset_sensor",
@@ -476,7 +736,6 @@ class ZombieEnvironment:
                 "room": room,
             },
         )
-        self.state = deepcopy(new_state)
         return new_state
 
     def block_room(self, floor: int, room: int) -> ZombieSimulationState:
@@ -495,9 +754,9 @@ class ZombieEnvironment:
         ZombieSimulationState
             The new simulation state after blocking the room.
         """
-        new_state = deepcopy(self.state)
+        new_state = self._clone_state(self.state)
         self._assert_bounds(new_state, floor, room)
-        new_state.building.floors[floor].rooms[room].blocked = True
+        self._own_rooms(new_state, [(floor, room)])[(floor, room)].blocked = True
         new_state = self._apply_update(
             new_state,
             "block_room",
@@ -506,7 +765,6 @@ class ZombieEnvironment:
                 "room": room,
             },
         )
-        self.state = deepcopy(new_state)
         return new_state
 
     def unblock_room(self, floor: int, room: int) -> ZombieSimulationState:
@@ -525,11 +783,10 @@ class ZombieEnvironment:
         ZombieSimulationState
             The new simulation state after unblocking the room.
         """
-        new_state = deepcopy(self.state)
+        new_state = self._clone_state(self.state)
         self._assert_bounds(new_state, floor, room)
-        new_state.building.floors[floor].rooms[room].blocked = False
+        self._own_rooms(new_state, [(floor, room)])[(floor, room)].blocked = False
         new_state = self._apply_update(new_state, "unblock_room", {})
-        self.state = deepcopy(new_state)
         return new_state
 
     def reset_simulation(self, infected_coords: None | dict) -> ZombieSimulationState:
@@ -551,6 +808,5 @@ class ZombieEnvironment:
             infection_events_log=[],
         )
         new_state = self._apply_update(new_state, "reset_simulation", {})
-        self.state = deepcopy(new_state)
         self._simulation_initialization()
         return new_state